@@ -4,23 +4,56 @@ Configuration centralisée pour GreenPower RAG System
 import os
 import re
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (une seule fois par processus: les workers
+# du ProcessPool héritent de l'environnement, inutile de relire le .env)
+if not os.environ.get('_GREENPOWER_ENV_LOADED'):
+    from dotenv import load_dotenv
+    load_dotenv()
+    os.environ['_GREENPOWER_ENV_LOADED'] = '1'
 
 # API Keys
 MISTRAL_API_KEY = os.getenv('MISTRAL_API_KEY')
 QDRANT_URL = os.getenv('QDRANT_URL', ':memory:')
 QDRANT_API_KEY = os.getenv('QDRANT_API_KEY', None)
+# gRPC (port 6334): vecteurs en binaire au lieu de JSON
+QDRANT_PREFER_GRPC = os.getenv('QDRANT_PREFER_GRPC', 'true').lower() == 'true'
+QDRANT_GRPC_PORT = int(os.getenv('QDRANT_GRPC_PORT', '6334'))
+QDRANT_TIMEOUT = 30
 
 # Collection name
 COLLECTION_NAME = "greenpower_docs"
 
+# Taille des lots de points envoyés à Qdrant (requêtes courtes, jamais bloquantes)
+UPSERT_BATCH_SIZE = 128
+# Au-delà de ce nombre de points, l'index HNSW est suspendu pendant l'upload
+# puis reconstruit une seule fois (seuil d'indexation rétabli à la fin)
+BULK_UPLOAD_MIN_POINTS = 10000
+QDRANT_INDEXING_THRESHOLD = 20000
+
 # Chunking configuration
 CHUNK_SIZE = 500
 CHUNK_OVERLAP = 50
+# Découpage en tokens du modèle d'embedding (repli sur les caractères si tokenizer absent)
+CHUNK_SIZE_TOKENS = 128
+CHUNK_OVERLAP_TOKENS = 16
 EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# 'huggingface' (PyTorch, float16 sur GPU) ou 'fastembed' (ONNX Runtime, même modèle, plus rapide sur CPU)
+EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'huggingface')
+EMBEDDING_BATCH_SIZE = 64
+# Sur GPU (CUDA, poids en float16): lots plus gros pour occuper le device
+EMBEDDING_GPU_BATCH_SIZE = 256
+EMBEDDING_CACHE_PATH = os.getenv(
+    'EMBEDDING_CACHE_PATH', str(Path(__file__).parent / '.embedding_cache.sqlite')
+)
+
+# Recherche: résultats récupérés une fois au maximum du slider top_k, puis re-découpés
+SEARCH_MAX_TOP_K = 10
+# Recherche sur les vecteurs int8, candidats re-classés avec les vecteurs originaux
+SEARCH_OVERSAMPLING = 2.0
+QUERY_CACHE_SIZE = 256
+# Embeddings de questions gardés en mémoire (float32: ~1.5 Ko par question)
+QUERY_EMBEDDING_CACHE_SIZE = 2048
 
 # LLM configuration
 MISTRAL_MODEL = "mistral-small-latest"
@@ -39,6 +72,20 @@ TEMPORAL_KEYWORDS = [
     'cours', 'cotation', 'taux', 'rate'
 ]
 
+# Une seule alternation compilée: un passage sur le texte au lieu d'un `in` par mot-clé
+# (pas de \b: même sémantique "sous-chaîne" que la liste, ex: 'prix' dans 'prix_2025.csv')
+TEMPORAL_PATTERN = re.compile(
+    '|'.join(map(re.escape, TEMPORAL_KEYWORDS)), re.IGNORECASE
+)
+
+# Neo4j driver (pool de connexions partagé entre les threads d'upload)
+NEO4J_MAX_CONNECTION_POOL_SIZE = 50
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = 60
+# Lignes UNWIND par transaction: les gros fichiers sont écrits en plusieurs commits
+NEO4J_WRITE_BATCH_SIZE = 10000
+# Statistiques Neo4j réutilisées pendant ce délai (invalidées à chaque import)
+NEO4J_STATS_TTL = 30
+
 # Interface configuration
 GRADIO_SERVER_NAME = "127.0.0.1"
 GRADIO_SERVER_PORT = 7865
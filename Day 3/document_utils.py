@@ -1,32 +1,132 @@
 """
 Document Loading Utilities
 """
-from typing import List, Dict
-from pathlib import Path
-import pypdf
-import docx
-import json
+import mmap
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Iterator, Optional, Tuple
+import orjson
 import csv
+import zipfile
+from xml.etree import ElementTree
+
+
+# Namespace WordprocessingML (balises de word/document.xml)
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Au-delà de cette taille, les fichiers texte sont lus via mmap
+MMAP_THRESHOLD = 1024 * 1024
+
+
+@contextmanager
+def _mapped_file(file_path: str) -> Iterator[Optional[memoryview]]:
+    """
+    Projette un gros fichier en mémoire (mmap) sans copie intermédiaire
+    
+    Yields:
+        memoryview sur le fichier, ou None s'il est sous MMAP_THRESHOLD
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield None
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                # Le mmap ne peut être fermé tant qu'une vue existe
+                view.release()
+
+
+# Moteurs PDF importés au premier PDF seulement: l'import du module reste léger
+@lru_cache(maxsize=1)
+def _get_pdfium():
+    """Module pypdfium2, ou None s'il n'est pas installé"""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:  # pypdfium2 optionnel: repli sur pypdf
+        return None
+    return pdfium
+
+
+def _load_pdf_pdfium(file_path: str) -> str:
+    """Extraction PDF via pdfium (moteur C++, ~10x plus rapide que pypdf)"""
+    pdf = _get_pdfium().PdfDocument(file_path)
+    try:
+        parts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_bounded()
+            textpage.close()
+            page.close()
+            if page_text:
+                parts.append(page_text)
+        return "\n".join(parts)
+    finally:
+        pdf.close()
 
 
 def load_pdf(file_path: str) -> str:
-    """Charge un fichier PDF"""
+    """Charge un fichier PDF (pdfium si disponible, sinon pypdf)"""
+    if _get_pdfium() is not None:
+        try:
+            return _load_pdf_pdfium(file_path)
+        except Exception as e:
+            print(f"⚠️ pdfium a échoué ({e}), repli sur pypdf")
+    
     try:
+        import pypdf
         reader = pypdf.PdfReader(file_path)
-        text = ""
+        parts = []
         for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+            page_text = page.extract_text()
+            # Pages vides (scans, pages blanches) ignorées
+            if page_text:
+                parts.append(page_text)
+        return "\n".join(parts)
     except Exception as e:
         raise Exception(f"Erreur lecture PDF: {str(e)}")
 
 
 def load_docx(file_path: str) -> str:
-    """Charge un fichier DOCX"""
+    """Charge un fichier DOCX (lecture en flux du XML, sans modèle objet)"""
     try:
-        doc = docx.Document(file_path)
-        text = "\n".join([para.text for para in doc.paragraphs])
-        return text
+        paragraphs = []
+        current = []
+        in_properties = 0
+        
+        with zipfile.ZipFile(file_path) as archive, archive.open('word/document.xml') as xml:
+            for event, element in ElementTree.iterparse(xml, events=('start', 'end')):
+                tag = element.tag
+                
+                # Les <w:tab> de <w:pPr> sont des taquets, pas du texte
+                if tag == _W_NS + 'pPr':
+                    in_properties += 1 if event == 'start' else -1
+                    continue
+                if event == 'start':
+                    continue
+                
+                if tag == _W_NS + 't':
+                    current.append(element.text or '')
+                elif tag == _W_NS + 'tab' and not in_properties:
+                    current.append('\t')
+                elif tag in (_W_NS + 'br', _W_NS + 'cr'):
+                    current.append('\n')
+                elif tag == _W_NS + 'p':
+                    paragraphs.append(''.join(current))
+                    current = []
+                    # Libère les nœuds déjà lus: mémoire constante
+                    element.clear()
+        
+        return "\n".join(paragraphs)
     except Exception as e:
         raise Exception(f"Erreur lecture DOCX: {str(e)}")
 
@@ -34,6 +134,15 @@ def load_docx(file_path: str) -> str:
 def load_txt(file_path: str) -> str:
     """Charge un fichier TXT"""
     try:
+        with _mapped_file(file_path) as view:
+            if view is not None:
+                # Décodage direct depuis les pages mappées, fins de ligne
+                # normalisées comme en mode texte (mêmes chunks quelle que soit la taille)
+                text = str(view, 'utf-8')
+                if '\r' in text:
+                    text = text.replace('\r\n', '\n').replace('\r', '\n')
+                return text
+        
         with open(file_path, 'r', encoding='utf-8') as f:
             return f.read()
     except Exception as e:
@@ -43,9 +152,14 @@ def load_txt(file_path: str) -> str:
 def load_json(file_path: str) -> str:
     """Charge un fichier JSON et le convertit en texte"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        # orjson lit directement les octets (pas de décodage texte intermédiaire)
+        with _mapped_file(file_path) as view:
+            if view is not None:
+                data = orjson.loads(view)
+            else:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
     except Exception as e:
         raise Exception(f"Erreur lecture JSON: {str(e)}")
 
@@ -53,21 +167,83 @@ def load_json(file_path: str) -> str:
 def load_csv(file_path: str) -> str:
     """Charge un fichier CSV et le convertit en texte"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        
-        # Convert to readable text
-        text_lines = []
-        for row in rows:
-            line = ", ".join([f"{k}: {v}" for k, v in row.items()])
-            text_lines.append(line)
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return ""
+            
+            # Convert to readable text (sans dict intermédiaire par ligne)
+            # Même rendu que csv.DictReader: lignes vides ignorées, colonnes
+            # manquantes à None, valeurs en trop regroupées sous None
+            text_lines = []
+            for row in reader:
+                if not row:
+                    continue
+                pairs = [f"{h}: {v}" for h, v in zip(header, row)]
+                if len(row) < len(header):
+                    pairs.extend(f"{h}: None" for h in header[len(row):])
+                elif len(row) > len(header):
+                    pairs.append(f"None: {row[len(header):]}")
+                text_lines.append(", ".join(pairs))
         
         return "\n".join(text_lines)
     except Exception as e:
         raise Exception(f"Erreur lecture CSV: {str(e)}")
 
 
+# Dispatch extension → loader, construit une seule fois à l'import
+LOADERS = MappingProxyType({
+    '.pdf': load_pdf,
+    '.docx': load_docx,
+    '.doc': load_docx,
+    '.txt': load_txt,
+    '.json': load_json,
+    '.csv': load_csv,
+})
+
+
+# Textes déjà chargés: (chemin, mtime, taille) invalident l'entrée si le fichier change
+_DOCUMENT_CACHE_SIZE = 32
+_document_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_document_cache_lock = threading.Lock()
+
+
+def _document_cache_key(file_path: str) -> Tuple[str, int, int]:
+    """Clé du cache: chemin + mtime + taille"""
+    stat = os.stat(file_path)
+    return (file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _document_cache_get(key: Tuple[str, int, int]) -> Optional[str]:
+    """Texte en cache (marqué récemment utilisé), ou None"""
+    with _document_cache_lock:
+        text = _document_cache.get(key)
+        if text is not None:
+            _document_cache.move_to_end(key)
+        return text
+
+
+def _document_cache_put(key: Tuple[str, int, int], text: str) -> None:
+    """Ajoute un texte au cache (évince le moins récemment utilisé)"""
+    with _document_cache_lock:
+        _document_cache[key] = text
+        _document_cache.move_to_end(key)
+        if len(_document_cache) > _DOCUMENT_CACHE_SIZE:
+            _document_cache.popitem(last=False)
+
+
+def _load_document_uncached(file_path: str) -> str:
+    """Charge un document selon son extension, sans passer par le cache"""
+    extension = os.path.splitext(file_path)[1].lower()
+    
+    loader = LOADERS.get(extension)
+    if not loader:
+        raise ValueError(f"Format non supporté: {extension}")
+    
+    return loader(file_path)
+
+
 def load_document(file_path: str) -> str:
     """
     Charge un document selon son extension
@@ -78,23 +254,124 @@ def load_document(file_path: str) -> str:
     Returns:
         Contenu du document en texte
     """
-    file_path = Path(file_path)
-    extension = file_path.suffix.lower()
-    
-    loaders = {
-        '.pdf': load_pdf,
-        '.docx': load_docx,
-        '.doc': load_docx,
-        '.txt': load_txt,
-        '.json': load_json,
-        '.csv': load_csv,
-    }
-    
-    loader = loaders.get(extension)
-    if not loader:
-        raise ValueError(f"Format non supporté: {extension}")
+    file_path = str(file_path)
+    key = _document_cache_key(file_path)
+    text = _document_cache_get(key)
+    if text is None:
+        text = _load_document_uncached(file_path)
+        _document_cache_put(key, text)
+    return text
+
+
+def _load_document_safe(file_path: str) -> Dict:
+    """Chargement sans lever: résultat ou erreur par fichier (exécuté en sous-process)"""
+    try:
+        return {'success': True, 'text': _load_document_uncached(file_path)}
+    except Exception as e:
+        return {'success': False, 'error': str(e)}
+
+
+_loader_pool = None
+_loader_pool_lock = threading.Lock()
+
+
+def _get_loader_pool() -> ProcessPoolExecutor:
+    """
+    Pool de processus partagé, créé au premier chargement multi-fichiers
+    
+    forkserver (spawn à défaut): un fork du process Gradio, multi-threadé
+    (serveur, pools de threads, torch), peut bloquer le process enfant.
+    """
+    global _loader_pool
+    with _loader_pool_lock:
+        if _loader_pool is None:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _loader_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _loader_pool
+
+
+def load_documents_batch(file_paths: List[str]) -> List[Dict]:
+    """
+    Charge plusieurs documents en parallèle (un process par cœur)
+    
+    L'extraction (PDF surtout) est CPU-bound: un pool de processus
+    contourne le GIL. Les fichiers déjà en cache ne sont pas relus; un seul
+    fichier à charger l'est dans le process courant.
+    
+    Returns:
+        Un dict par fichier, dans l'ordre: {'success', 'text'} ou {'success', 'error'}
+    """
+    file_paths = [str(file_path) for file_path in file_paths]
+    results: List[Optional[Dict]] = [None] * len(file_paths)
+    
+    # Cache du process courant d'abord (celui des workers n'est pas partagé)
+    misses = []
+    for i, file_path in enumerate(file_paths):
+        try:
+            key = _document_cache_key(file_path)
+        except OSError as e:
+            results[i] = {'success': False, 'error': str(e)}
+            continue
+        text = _document_cache_get(key)
+        if text is not None:
+            results[i] = {'success': True, 'text': text}
+        else:
+            misses.append((i, key))
+    
+    paths = [key[0] for _, key in misses]
+    if len(paths) <= 1:
+        loaded = [_load_document_safe(file_path) for file_path in paths]
+    else:
+        loaded = list(_get_loader_pool().map(_load_document_safe, paths))
+    
+    for (i, key), result in zip(misses, loaded):
+        if result['success']:
+            _document_cache_put(key, result['text'])
+        results[i] = result
     
-    return loader(str(file_path))
+    return results
+
+
+class TokenWindowSplitter:
+    """
+    Découpe un texte en fenêtres de tokens du modèle d'embedding
+    
+    Le texte est tokenisé une seule fois; les offsets (fast tokenizer)
+    redonnent le texte exact de chaque fenêtre. Chaque chunk tient ainsi
+    dans la longueur max du modèle, sans troncature à l'encodage.
+    Même interface que les splitters LangChain (split_text).
+    """
+    
+    def __init__(self, tokenizer, chunk_size: int, chunk_overlap: int):
+        if chunk_overlap >= chunk_size:
+            raise ValueError("chunk_overlap doit être inférieur à chunk_size")
+        self.tokenizer = tokenizer
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+    
+    def split_text(self, text: str) -> List[str]:
+        """Retourne les chunks (fenêtres chevauchantes de chunk_size tokens)"""
+        offsets = self.tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            verbose=False,
+        )['offset_mapping']
+        
+        chunks = []
+        step = self.chunk_size - self.chunk_overlap
+        for start in range(0, len(offsets), step):
+            window = offsets[start:start + self.chunk_size]
+            chunk = text[window[0][0]:window[-1][1]].strip()
+            if chunk:
+                chunks.append(chunk)
+            if start + self.chunk_size >= len(offsets):
+                break
+        
+        return chunks
 
 
 def split_into_chunks(text: str, text_splitter) -> List[Dict]:
@@ -103,12 +380,14 @@ def split_into_chunks(text: str, text_splitter) -> List[Dict]:
     
     Args:
         text: Texte à découper
-        text_splitter: LangChain text splitter
+        text_splitter: Splitter LangChain, TokenWindowSplitter ou semantic-text-splitter
         
     Returns:
         Liste de documents avec text et metadata
     """
-    chunks = text_splitter.split_text(text)
+    # LangChain / TokenWindowSplitter: split_text; semantic-text-splitter: chunks
+    split = getattr(text_splitter, 'split_text', None) or text_splitter.chunks
+    chunks = split(text)
     
     documents = []
     for chunk in chunks:
@@ -0,0 +1,96 @@
+"""
+Persistent Embedding Cache (SQLite)
+
+Chaque texte est identifié par SHA-256(modèle + texte): un chunk déjà vu
+n'est plus ré-encodé, même après redémarrage de l'application.
+"""
+import hashlib
+import sqlite3
+import threading
+from typing import Callable, List, Sequence
+
+import numpy as np
+
+from config import EMBEDDING_CACHE_PATH, EMBEDDING_MODEL
+
+
+_connection = None
+_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Ouvre (une seule fois) la base SQLite du cache"""
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(EMBEDDING_CACHE_PATH, check_same_thread=False)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+        _connection.commit()
+    return _connection
+
+
+def _hash_text(text: str, model_key: str = EMBEDDING_MODEL) -> bytes:
+    """Clé du cache: SHA-256 du modèle et du texte"""
+    return hashlib.sha256(f"{model_key}\x00{text}".encode('utf-8')).digest()
+
+
+def get_or_compute(
+    texts: List[str],
+    encode_fn: Callable[[List[str]], Sequence[Sequence[float]]],
+    model_key: str = EMBEDDING_MODEL
+) -> np.ndarray:
+    """
+    Retourne les embeddings des chunks, en n'encodant que les absents du cache
+
+    Réservé aux chunks indexés: les questions ne sont pas persistées,
+    sinon chaque requête tapée dans l'interface resterait sur disque.
+
+    Args:
+        texts: Textes à encoder
+        encode_fn: Fonction d'encodage batch (ex: embeddings.embed_documents)
+        model_key: Identifiant modèle/backend (les vecteurs ne sont pas interchangeables)
+
+    Returns:
+        Matrice float32 de forme (len(texts), dim) - (0, 0) si texts est vide
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    keys = [_hash_text(text, model_key) for text in texts]
+
+    with _lock:
+        conn = _get_connection()
+        cached = {}
+        unique_keys = list(dict.fromkeys(keys))
+        # SQLite limite le nombre de paramètres par requête
+        for start in range(0, len(unique_keys), 500):
+            batch = unique_keys[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})", batch
+            )
+            for key, blob in rows:
+                cached[key] = np.frombuffer(blob, dtype=np.float32)
+
+    # Encoder uniquement les textes absents du cache (sans doublons)
+    misses = {}
+    for key, text in zip(keys, texts):
+        if key not in cached and key not in misses:
+            misses[key] = text
+
+    if misses:
+        vectors = np.asarray(encode_fn(list(misses.values())), dtype=np.float32)
+        new_rows = []
+        for key, vector in zip(misses, vectors):
+            cached[key] = vector
+            new_rows.append((key, vector.tobytes()))
+
+        with _lock:
+            conn = _get_connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, vec) VALUES (?, ?)", new_rows
+            )
+            conn.commit()
+
+    return np.stack([cached[key] for key in keys])
@@ -1,24 +1,75 @@
+import asyncio
 import gradio as gr
 from pathlib import Path
-from typing import List, Dict, Any
-import json
+from typing import List, Dict, Any, Optional, Tuple
+from collections import defaultdict
+from functools import cache, lru_cache, wraps
+import orjson
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, RoutingControl
 
 from config import (
+    NEO4J_MAX_CONNECTION_POOL_SIZE, NEO4J_CONNECTION_ACQUISITION_TIMEOUT, NEO4J_WRITE_BATCH_SIZE,
+    NEO4J_STATS_TTL,
     COLLECTION_NAME, QDRANT_URL, EMBEDDING_MODEL,
-    CHUNK_SIZE, CHUNK_OVERLAP, PRIVATE_PATTERN, TEMPORAL_KEYWORDS,
+    CHUNK_SIZE_TOKENS, CHUNK_OVERLAP_TOKENS, PRIVATE_PATTERN, TEMPORAL_KEYWORDS,
     GRADIO_SERVER_NAME, GRADIO_SERVER_PORT, GRADIO_SHARE
 )
 from qdrant_connect import QdrantConnector
 from rag_features import SimpleRAG
-from document_utils import load_document, split_into_chunks
+from document_utils import load_documents_batch, split_into_chunks
+
+
+@lru_cache(maxsize=1024)
+def _node_merge_query(label: str) -> str:
+    """Requête UNWIND/MERGE des nœuds d'un label (texte identique → plan Neo4j réutilisé)"""
+    return f"""
+    UNWIND $rows AS row
+    MERGE (n:{label} {{id: row.id}})
+    SET n += row.props
+    """
+
+
+@lru_cache(maxsize=1024)
+def _rel_merge_query(from_type: str, rel: str, to_type: str) -> str:
+    """Requête UNWIND/MERGE des relations (from_type)-[rel]->(to_type)"""
+    return f"""
+    UNWIND $rows AS row
+    MATCH (from:{from_type} {{id: row.from_id}})
+    MERGE (to:{to_type} {{id: row.to_id}})
+    SET to += row.to_props
+    MERGE (from)-[r:{rel}]->(to)
+    """
+
+
+def _split_props(entity: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Tuple[str, Any]]]:
+    """Sépare en un seul passage propriétés scalaires et valeurs imbriquées (dict/list)"""
+    scalars = {}
+    nested = []
+    for key, value in entity.items():
+        if isinstance(value, (dict, list)):
+            nested.append((key, value))
+        else:
+            scalars[key] = value
+    return scalars, nested
 
 
 class Neo4jFeeder:
     def __init__(self, uri: str, username: str, password: str):
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(username, password),
+            max_connection_pool_size=NEO4J_MAX_CONNECTION_POOL_SIZE,
+            connection_acquisition_timeout=NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        )
+        self._constrained_labels = set()
+        self._constraints_lock = threading.Lock()
+        # (instant monotonic, stats) de la dernière lecture
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
     
     def close(self):
         self.driver.close()
@@ -26,25 +77,30 @@ class Neo4jFeeder:
     def process_json_file(self, file_path: str) -> Dict[str, Any]:
         """Traite un fichier JSON et l'insère dans Neo4j"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            stats = {
-                'nodes_created': 0,
-                'relationships_created': 0,
-                'errors': []
-            }
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # Détection automatique du type de données
             if isinstance(data, list):
-                for item in data:
-                    result = self._process_entity(item)
-                    stats['nodes_created'] += result.get('nodes', 0)
-                    stats['relationships_created'] += result.get('rels', 0)
+                entities = data
             elif isinstance(data, dict):
-                result = self._process_entity(data)
-                stats['nodes_created'] += result.get('nodes', 0)
-                stats['relationships_created'] += result.get('rels', 0)
+                entities = [data]
+            else:
+                entities = []
+            
+            node_rows, rel_rows = [], []
+            for entity in entities:
+                entity_nodes, entity_rels = self._flatten_entity(entity)
+                node_rows.extend(entity_nodes)
+                rel_rows.extend(entity_rels)
+            
+            self._write_file(node_rows, rel_rows)
+            
+            stats = {
+                'nodes_created': len(node_rows),
+                'relationships_created': len(rel_rows),
+                'errors': []
+            }
             
             return {
                 'success': True,
@@ -59,151 +115,258 @@ class Neo4jFeeder:
                 'timestamp': datetime.now().isoformat()
             }
     
-    def _process_entity(self, entity: Dict[str, Any]) -> Dict[str, int]:
-        """Traite une entité et crée les nœuds/relations correspondants"""
-        stats = {'nodes': 0, 'rels': 0}
-        
-        with self.driver.session() as session:
-            # Détection du type d'entité
-            entity_type = entity.get('type', 'Entity')
-            entity_id = entity.get('id', entity.get('name', ''))
-            
-            # Création du nœud principal
-            properties = {k: v for k, v in entity.items() 
-                         if not isinstance(v, (dict, list))}
-            
-            query = f"""
-            MERGE (n:{entity_type} {{id: $id}})
-            SET n += $properties
-            RETURN n
-            """
-            
-            session.run(query, id=entity_id, properties=properties)
-            stats['nodes'] += 1
-            
-            # Traitement des relations
-            for key, value in entity.items():
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict):
-                            rel_stats = self._create_relationship(
-                                session, entity_type, entity_id, key, item
-                            )
-                            stats['rels'] += rel_stats
-                elif isinstance(value, dict):
-                    rel_stats = self._create_relationship(
-                        session, entity_type, entity_id, key, value
-                    )
-                    stats['rels'] += rel_stats
+    def _write_file(self, node_rows: List[Dict], rel_rows: List[Dict]) -> None:
+        """
+        Écrit toutes les entités d'un fichier dans une session
         
-        return stats
+        Jusqu'à NEO4J_WRITE_BATCH_SIZE lignes: un seul commit. Au-delà, lots
+        de NEO4J_WRITE_BATCH_SIZE (nœuds d'abord, puis relations) pour borner
+        la mémoire de transaction côté serveur.
+        """
+        if not node_rows:
+            return
+        
+        labels = {row['type'] for row in node_rows}
+        labels.update(row['to_type'] for row in rel_rows)
+        self._ensure_constraints(labels)
+        
+        # Une requête UNWIND par label / type de relation et par transaction
+        # (execute_write rejoue la transaction en cas d'erreur transitoire / deadlock)
+        batch = NEO4J_WRITE_BATCH_SIZE
+        try:
+            with self.driver.session() as session:
+                if len(node_rows) + len(rel_rows) <= batch:
+                    session.execute_write(self._write_rows, node_rows, rel_rows)
+                    return
+                
+                # Les relations font un MATCH sur leur nœud source: nœuds d'abord
+                for start in range(0, len(node_rows), batch):
+                    session.execute_write(self._write_rows, node_rows[start:start + batch], [])
+                for start in range(0, len(rel_rows), batch):
+                    session.execute_write(self._write_rows, [], rel_rows[start:start + batch])
+        finally:
+            # Invalidé après l'écriture: un get_stats concurrent ne peut pas
+            # remettre en cache les compteurs d'avant l'import
+            self._stats_cache = None
     
-    def _create_relationship(self, session, from_type: str, from_id: str, 
-                            rel_name: str, to_entity: Dict) -> int:
-        """Crée une relation entre deux entités"""
-        to_type = to_entity.get('type', rel_name.title())
-        to_id = to_entity.get('id', to_entity.get('name', ''))
-        
-        to_properties = {k: v for k, v in to_entity.items() 
-                        if not isinstance(v, (dict, list))}
-        
-        query = f"""
-        MATCH (from:{from_type} {{id: $from_id}})
-        MERGE (to:{to_type} {{id: $to_id}})
-        SET to += $to_properties
-        MERGE (from)-[r:{rel_name.upper()}]->(to)
-        RETURN r
+    def _ensure_constraints(self, labels: set) -> None:
         """
+        Crée une contrainte d'unicité sur `id` pour chaque label
         
-        session.run(query, from_id=from_id, to_id=to_id, 
-                   to_properties=to_properties)
-        return 1
+        Plusieurs fichiers sont importés en parallèle: sans contrainte,
+        deux MERGE concurrents sur la même clé peuvent créer des doublons.
+        """
+        with self._constraints_lock:
+            missing = labels - self._constrained_labels
+            if not missing:
+                return
+            
+            for label in missing:
+                try:
+                    self.driver.execute_query(
+                        f"CREATE CONSTRAINT IF NOT EXISTS "
+                        f"FOR (n:{label}) REQUIRE n.id IS UNIQUE"
+                    )
+                except Exception as e:
+                    # Ex: doublons déjà présents en base
+                    print(f"⚠️ Contrainte d'unicité impossible sur :{label}: {e}")
+                self._constrained_labels.add(label)
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Retourne les statistiques de la base Neo4j"""
-        with self.driver.session() as session:
-            result = session.run("""
-            MATCH (n)
-            RETURN count(n) as total_nodes,
-                   count(distinct labels(n)) as node_types
-            """)
-            record = result.single()
-            
-            rel_result = session.run("""
+    def _flatten_entity(self, entity: Dict[str, Any]) -> Tuple[List[Dict], List[Dict]]:
+        """Aplatit une entité en lignes nœuds/relations pour UNWIND"""
+        # Détection du type d'entité
+        entity_type = entity.get('type', 'Entity')
+        entity_id = entity.get('id', entity.get('name', ''))
+        
+        # Nœud principal (propriétés scalaires) + valeurs imbriquées (relations)
+        properties, nested = _split_props(entity)
+        node_rows = [{'type': entity_type, 'id': entity_id, 'props': properties}]
+        
+        # Relations
+        rel_rows = []
+        for key, value in nested:
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        rel_rows.append(
+                            self._relationship_row(entity_type, entity_id, key, item)
+                        )
+            else:
+                rel_rows.append(
+                    self._relationship_row(entity_type, entity_id, key, value)
+                )
+        
+        return node_rows, rel_rows
+    
+    def _relationship_row(self, from_type: str, from_id: str, 
+                          rel_name: str, to_entity: Dict) -> Dict[str, Any]:
+        """Décrit une relation entre deux entités"""
+        to_properties, _ = _split_props(to_entity)
+        
+        return {
+            'from_type': from_type,
+            'from_id': from_id,
+            'rel': rel_name.upper(),
+            'to_type': to_entity.get('type', rel_name.title()),
+            'to_id': to_entity.get('id', to_entity.get('name', '')),
+            'to_props': to_properties,
+        }
+    
+    @staticmethod
+    def _write_rows(tx, node_rows: List[Dict], rel_rows: List[Dict]) -> None:
+        """Écrit les nœuds puis les relations, groupés par label / type"""
+        # Les labels et types de relation ne sont pas paramétrables en Cypher
+        nodes_by_label = defaultdict(list)
+        for row in node_rows:
+            nodes_by_label[row['type']].append(row)
+        
+        for label, rows in nodes_by_label.items():
+            tx.run(_node_merge_query(label), rows=rows)
+        
+        rels_by_type = defaultdict(list)
+        for row in rel_rows:
+            rels_by_type[(row['from_type'], row['rel'], row['to_type'])].append(row)
+        
+        for (from_type, rel, to_type), rows in rels_by_type.items():
+            tx.run(_rel_merge_query(from_type, rel, to_type), rows=rows)
+    
+    def get_stats(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Retourne les statistiques de la base Neo4j
+        
+        Args:
+            force_refresh: Ignorer le cache (NEO4J_STATS_TTL secondes)
+        """
+        cached = self._stats_cache
+        if cached is not None and not force_refresh and time.monotonic() - cached[0] < NEO4J_STATS_TTL:
+            return cached[1]
+        
+        # Une seule requête, en lecture (routée vers un réplica en cluster)
+        records, _, _ = self.driver.execute_query("""
+        MATCH (n)
+        WITH count(n) as total_nodes,
+             count(distinct labels(n)) as node_types
+        CALL {
             MATCH ()-[r]->()
             RETURN count(r) as total_relationships
-            """)
-            rel_record = rel_result.single()
-            
-            return {
-                'total_nodes': record['total_nodes'],
-                'node_types': record['node_types'],
-                'total_relationships': rel_record['total_relationships']
-            }
-
+        }
+        RETURN total_nodes, node_types, total_relationships
+        """, routing_=RoutingControl.READ)
+        record = records[0]
+        
+        stats = {
+            'total_nodes': record['total_nodes'],
+            'node_types': record['node_types'],
+            'total_relationships': record['total_relationships']
+        }
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
 
-# Initialize components
-qdrant = QdrantConnector()
-rag = SimpleRAG()
 
 # Initialize Neo4j (from environment variables)
 NEO4J_URI = os.getenv("NEO4J_URI", "neo4j+s://xxxxx.databases.neo4j.io")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "")
 
-neo4j_feeder = None
 upload_history = []
+upload_history_lock = threading.Lock()
 
-try:
-    if NEO4J_PASSWORD:
-        neo4j_feeder = Neo4jFeeder(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
-        print("✅ Neo4j connecté")
-    else:
-        print("⚠️ Neo4j non configuré (vérifier .env)")
-except Exception as e:
-    print(f"⚠️ Erreur connexion Neo4j: {e}")
 
-# Create collection at startup
-print("\n" + "="*70)
-print("🔧 Initialisation GreenPower RAG System...")
-print("="*70)
-result = qdrant.create_collection()
-print(result)
+def _singleton(factory):
+    """Construit l'objet au premier appel seulement (une fois, même entre threads)"""
+    cached_factory = cache(factory)
+    lock = threading.Lock()
+    
+    @wraps(factory)
+    def getter():
+        with lock:
+            return cached_factory()
+    
+    return getter
+
+
+# Initialize components (paresseux: rien n'est chargé ni connecté à l'import)
+@_singleton
+def get_qdrant() -> QdrantConnector:
+    """Connecteur Qdrant partagé, collection créée au premier appel"""
+    print("\n" + "="*70)
+    print("🔧 Initialisation GreenPower RAG System...")
+    print("="*70)
+    qdrant = QdrantConnector()
+    print(qdrant.create_collection())
+    return qdrant
 
 
-def upload_and_index(file) -> str:
-    """Upload et indexation d'un fichier"""
-    if file is None:
+@_singleton
+def get_rag() -> SimpleRAG:
+    """Pipeline RAG partagé (modèle d'embedding + client Mistral)"""
+    return SimpleRAG()
+
+
+@_singleton
+def get_neo4j() -> Optional[Neo4jFeeder]:
+    """Feeder Neo4j partagé, ou None si non configuré / injoignable"""
+    try:
+        if NEO4J_PASSWORD:
+            neo4j_feeder = Neo4jFeeder(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
+            print("✅ Neo4j connecté")
+            return neo4j_feeder
+        print("⚠️ Neo4j non configuré (vérifier .env)")
+    except Exception as e:
+        print(f"⚠️ Erreur connexion Neo4j: {e}")
+    return None
+
+
+def upload_and_index(files) -> str:
+    """Upload et indexation d'un ou plusieurs fichiers"""
+    if not files:
         return "⚠️ Aucun fichier sélectionné"
     
+    if not isinstance(files, list):
+        files = [files]
+    
     try:
-        # Load document
-        file_path = file.name
-        filename = Path(file_path).name
-        
-        print(f"\n📄 Traitement: {filename}")
-        text = load_document(file_path)
+        file_paths = [getattr(file, 'name', file) for file in files]
+        qdrant = get_qdrant()
         
-        # Split into chunks
-        documents = split_into_chunks(text, qdrant.text_splitter)
+        # Extraction du texte de tous les fichiers en parallèle (process pool)
+        loaded = load_documents_batch(file_paths)
         
-        # Index in Qdrant
-        result = qdrant.index_documents(documents, filename)
+        reports = []
+        for file_path, result in zip(file_paths, loaded):
+            filename = Path(file_path).name
+            print(f"\n📄 Traitement: {filename}")
+            
+            if not result['success']:
+                reports.append(f"### ❌ {filename}\n\nErreur: {result['error']}")
+                continue
+            
+            # Split into chunks
+            documents = split_into_chunks(result['text'], qdrant.text_splitter)
+            
+            # Index in Qdrant (upserts par lots en parallèle)
+            status = asyncio.run(qdrant.aindex_documents(documents, filename))
+            
+            reports.append(f"""### 📄 {filename}
+
+**Chunks créés:** {len(documents)}  
+
+{status}""")
         
         # Collection info
         info = qdrant.get_collection_info()
         total_docs = info.get('points_count', 0) if info.get('exists') else 0
         
+        report = "\n\n".join(reports)
         return f"""
-## ✅ Fichier Indexé
+## ✅ Indexation Terminée
 
-**Fichier:** {filename}  
-**Chunks créés:** {len(documents)}  
+**Fichiers traités:** {len(file_paths)}  
 **Total documents en base:** {total_docs}
 
-{result}
+{report}
 
-Vous pouvez maintenant poser des questions sur ce document !
+Vous pouvez maintenant poser des questions sur ces documents !
 """
     
     except Exception as e:
@@ -216,13 +379,14 @@ def search_and_answer(question: str, top_k: int = 3) -> str:
         return "⚠️ Veuillez poser une question"
     
     try:
-        return rag.search_and_answer(question, top_k)
+        return get_rag().search_and_answer(question, top_k)
     except Exception as e:
         return f"❌ Erreur: {str(e)}"
 
 
 def reset_collection() -> str:
     """Reset la collection Qdrant"""
+    qdrant = get_qdrant()
     result = qdrant.reset_collection()
     info = qdrant.get_collection_info()
     total_docs = info.get('points_count', 0) if info.get('exists') else 0
@@ -244,19 +408,37 @@ La base de données a été vidée. Vous pouvez uploader de nouveaux documents.
 
 def upload_json_to_neo4j(files: List[Any]) -> str:
     """Traite les fichiers JSON uploadés vers Neo4j"""
-    global upload_history
-    
+    neo4j_feeder = get_neo4j()
     if neo4j_feeder is None:
         return "❌ Neo4j non configuré. Vérifiez vos variables d'environnement (.env)"
     
     if not files:
         return "❌ Aucun fichier sélectionné"
     
-    results = []
-    for file in files:
-        file_path = file.name
-        result = neo4j_feeder.process_json_file(file_path)
+    # Chemins résolus avant la soumission (Gradio fournit des objets ou des str)
+    file_paths = [getattr(file, 'name', file) for file in files]
+    
+    # Chaque fichier est traité dans son propre thread (une session Neo4j par thread)
+    with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+        futures = [
+            executor.submit(neo4j_feeder.process_json_file, file_path)
+            for file_path in file_paths
+        ]
         
+        processed = []
+        for file_path, future in zip(file_paths, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {
+                    'success': False,
+                    'error': str(e),
+                    'timestamp': datetime.now().isoformat()
+                }
+            processed.append((file_path, result))
+    
+    results = []
+    for file_path, result in processed:
         if result['success']:
             stats = result['stats']
             message = f"✅ **{os.path.basename(file_path)}**\n"
@@ -264,11 +446,12 @@ def upload_json_to_neo4j(files: List[Any]) -> str:
             message += f"   - Relations créées: {stats['relationships_created']}\n"
             message += f"   - Timestamp: {result['timestamp']}\n"
             
-            upload_history.append({
-                'file': os.path.basename(file_path),
-                'timestamp': result['timestamp'],
-                'stats': stats
-            })
+            with upload_history_lock:
+                upload_history.append({
+                    'file': os.path.basename(file_path),
+                    'timestamp': result['timestamp'],
+                    'stats': stats
+                })
         else:
             message = f"❌ **{os.path.basename(file_path)}**\n"
             message += f"   - Erreur: {result['error']}\n"
@@ -278,13 +461,14 @@ def upload_json_to_neo4j(files: List[Any]) -> str:
     return "\n".join(results)
 
 
-def get_neo4j_stats() -> str:
-    """Affiche les statistiques de la base Neo4j"""
+def get_neo4j_stats(force_refresh: bool = False) -> str:
+    """Affiche les statistiques de la base Neo4j (force_refresh: ignorer le cache)"""
+    neo4j_feeder = get_neo4j()
     if neo4j_feeder is None:
         return "❌ Neo4j non configuré"
     
     try:
-        stats = neo4j_feeder.get_stats()
+        stats = neo4j_feeder.get_stats(force_refresh=force_refresh)
         return f"""
 ### 📊 Statistiques Neo4j
 
@@ -300,11 +484,14 @@ def get_neo4j_stats() -> str:
 
 def get_upload_history() -> str:
     """Affiche l'historique des uploads Neo4j"""
-    if not upload_history:
+    with upload_history_lock:
+        recent_uploads = upload_history[-10:]
+    
+    if not recent_uploads:
         return "📝 Aucun upload enregistré"
     
     history_text = "### 📜 Historique des uploads Neo4j\n\n"
-    for idx, upload in enumerate(reversed(upload_history[-10:]), 1):
+    for idx, upload in enumerate(reversed(recent_uploads), 1):
         history_text += f"{idx}. **{upload['file']}** ({upload['timestamp']})\n"
         history_text += f"   - Nœuds: {upload['stats']['nodes_created']}, "
         history_text += f"Relations: {upload['stats']['relationships_created']}\n\n"
@@ -341,7 +528,7 @@ with gr.Blocks(
         gr.Markdown(
             """
             ### Instructions:
-            1. Sélectionnez un fichier à uploader
+            1. Sélectionnez un ou plusieurs fichiers à uploader
             2. Le système va automatiquement:
                - Extraire le texte
                - Découper en chunks
@@ -355,7 +542,8 @@ with gr.Blocks(
         
         with gr.Row():
             file_input = gr.File(
-                label="📁 Sélectionnez un fichier",
+                label="📁 Sélectionnez un ou plusieurs fichiers",
+                file_count="multiple",
                 file_types=[".pdf", ".docx", ".doc", ".txt", ".json", ".csv"]
             )
         
@@ -490,8 +678,9 @@ with gr.Blocks(
             outputs=neo4j_history_output
         )
         
+        # Rafraîchissement explicite: toujours relu depuis Neo4j
         neo4j_stats_btn.click(
-            fn=get_neo4j_stats,
+            fn=lambda: get_neo4j_stats(force_refresh=True),
             outputs=neo4j_stats_output
         )
     
@@ -504,12 +693,12 @@ with gr.Blocks(
             - Platform: Qdrant ({QDRANT_URL})
             - Embeddings: {EMBEDDING_MODEL}
             - Collection: {COLLECTION_NAME}
-            - Chunk size: {CHUNK_SIZE} caractères
-            - Overlap: {CHUNK_OVERLAP} caractères
+            - Chunk size: {CHUNK_SIZE_TOKENS} tokens
+            - Overlap: {CHUNK_OVERLAP_TOKENS} tokens
             
             **Graph DB:**
             - Platform: Neo4j Aurora
-            - Status: {'✅ Connecté' if neo4j_feeder else '❌ Non configuré'}
+            - Status: {'✅ Configuré' if NEO4J_PASSWORD else '❌ Non configuré'}
             
             **LLM:**
             - Model: Mistral Small
@@ -589,6 +778,13 @@ with gr.Blocks(
 # ============================================================================
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        # Boucle libuv pour le serveur Gradio et les asyncio.run() des handlers
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # uvloop optionnel (indisponible sous Windows)
+        pass
+    
     print("\n" + "="*70)
     print("🚀 Lancement de l'interface Gradio...")
     print("="*70)
@@ -1,34 +1,195 @@
 """
 Qdrant Vector Database Connection and Operations
 """
+import asyncio
+import hashlib
+import threading
 import uuid
-from typing import List, Dict, Tuple
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Iterable, Tuple, Optional, Union
 from datetime import datetime
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
-from langchain_community.embeddings import HuggingFaceEmbeddings
+from qdrant_client import QdrantClient, AsyncQdrantClient
+import numpy as np
+from qdrant_client.models import (
+    Distance, Datatype, VectorParams, Batch, SearchRequest, OptimizersConfigDiff, HnswConfigDiff,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+    SearchParams, QuantizationSearchParams,
+    Filter, FieldCondition, MatchValue, PayloadSchemaType, FilterSelector
+)
+from langchain_community.embeddings import HuggingFaceEmbeddings, FastEmbedEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from embedding_cache import get_or_compute
+from document_utils import TokenWindowSplitter
 from config import (
-    QDRANT_URL, QDRANT_API_KEY, COLLECTION_NAME,
-    CHUNK_SIZE, CHUNK_OVERLAP, EMBEDDING_MODEL,
-    PRIVATE_PATTERN, TEMPORAL_KEYWORDS
+    QDRANT_URL, QDRANT_API_KEY, QDRANT_PREFER_GRPC, QDRANT_GRPC_PORT, QDRANT_TIMEOUT, COLLECTION_NAME,
+    CHUNK_SIZE, CHUNK_OVERLAP, CHUNK_SIZE_TOKENS, CHUNK_OVERLAP_TOKENS,
+    EMBEDDING_MODEL, EMBEDDING_BACKEND, EMBEDDING_BATCH_SIZE, EMBEDDING_GPU_BATCH_SIZE, UPSERT_BATCH_SIZE,
+    BULK_UPLOAD_MIN_POINTS, QDRANT_INDEXING_THRESHOLD,
+    SEARCH_OVERSAMPLING, PRIVATE_PATTERN, TEMPORAL_KEYWORDS, TEMPORAL_PATTERN, QUERY_EMBEDDING_CACHE_SIZE
 )
 
+try:
+    from semantic_text_splitter import TextSplitter as SemanticTextSplitter
+except ImportError:  # semantic-text-splitter optionnel: repli sur LangChain
+    SemanticTextSplitter = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick optionnel: repli sur TEMPORAL_PATTERN
+    ahocorasick = None
+
+try:
+    import torch
+except ImportError:  # torch absent (ex: backend fastembed seul): CPU
+    torch = None
+
+
+# Encodage des lots suivants pendant l'upload du lot courant
+# (un seul thread: le modèle partagé encode un lot à la fois)
+_EMBED_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='embed')
+
+
+def _build_temporal_automaton():
+    """Automate Aho-Corasick des mots-clés temporels (None si indisponible)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in TEMPORAL_KEYWORDS:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_TEMPORAL_AUTOMATON = _build_temporal_automaton()
+
+
+def has_temporal_keyword(text: str) -> bool:
+    """Détecte un mot-clé temporel en un seul passage sur le texte"""
+    if _TEMPORAL_AUTOMATON is not None:
+        # Premier match suffit: O(len(text)) quel que soit le nombre de mots-clés
+        for _ in _TEMPORAL_AUTOMATON.iter(text.lower()):
+            return True
+        return False
+    return bool(TEMPORAL_PATTERN.search(text))
+
+
+def _build_embeddings():
+    """
+    Modèle d'embedding selon EMBEDDING_BACKEND
+    
+    Returns:
+        (embeddings, clé du cache persistant propre au backend)
+    """
+    if EMBEDDING_BACKEND == 'fastembed':
+        try:
+            # ONNX Runtime: même modèle, sans le surcoût PyTorch sur CPU
+            embeddings = FastEmbedEmbeddings(
+                model_name=EMBEDDING_MODEL,
+                batch_size=EMBEDDING_BATCH_SIZE,
+            )
+            return embeddings, f"{EMBEDDING_MODEL}@fastembed"
+        except ImportError:
+            print("⚠️ fastembed non installé: repli sur HuggingFaceEmbeddings")
+    
+    use_cuda = torch is not None and torch.cuda.is_available()
+    embeddings = HuggingFaceEmbeddings(
+        model_name=EMBEDDING_MODEL,
+        model_kwargs={'device': 'cuda' if use_cuda else 'cpu'},
+        encode_kwargs={
+            'batch_size': EMBEDDING_GPU_BATCH_SIZE if use_cuda else EMBEDDING_BATCH_SIZE,
+            'normalize_embeddings': True,
+        },
+    )
+    if use_cuda:
+        # Poids en float16 sur GPU: débit doublé, écart négligeable une fois normalisé
+        embeddings.client.half()
+        # Vecteurs fp16 distincts des vecteurs CPU fp32: entrées de cache séparées
+        return embeddings, f"{EMBEDDING_MODEL}@cuda-fp16"
+    return embeddings, EMBEDDING_MODEL
+
+
+def _build_text_splitter(embeddings):
+    """Splitter en tokens du modèle d'embedding, ou en caractères à défaut"""
+    tokenizer = getattr(getattr(embeddings, 'client', None), 'tokenizer', None)
+    if tokenizer is not None and getattr(tokenizer, 'is_fast', False):
+        return TokenWindowSplitter(tokenizer, CHUNK_SIZE_TOKENS, CHUNK_OVERLAP_TOKENS)
+    
+    # Offsets indisponibles (tokenizer lent / fastembed): découpage en caractères
+    if SemanticTextSplitter is not None:
+        # Implémentation Rust: même découpage récursif, sans surcoût Python
+        return SemanticTextSplitter(CHUNK_SIZE, overlap=CHUNK_OVERLAP)
+    return RecursiveCharacterTextSplitter(
+        chunk_size=CHUNK_SIZE,
+        chunk_overlap=CHUNK_OVERLAP,
+        length_function=len,
+    )
+
+
+_shared_models = None
+_shared_models_lock = threading.Lock()
+
+
+def _get_shared_models():
+    """
+    Charge (une seule fois par processus) le modèle d'embedding et le splitter
+    
+    Returns:
+        (embeddings, embedding_key, text_splitter)
+    """
+    global _shared_models
+    with _shared_models_lock:
+        if _shared_models is None:
+            embeddings, embedding_key = _build_embeddings()
+            _shared_models = (embeddings, embedding_key, _build_text_splitter(embeddings))
+        return _shared_models
+
 
 class QdrantConnector:
     """Gestionnaire de connexion et opérations Qdrant"""
     
+    # Incrémenté à chaque écriture (index/reset): invalide les résultats mis en cache
+    write_generation = 0
+    
     def __init__(self):
-        self.client = QdrantClient(url=QDRANT_URL, api_key=QDRANT_API_KEY)
+        self._prefer_grpc = QDRANT_PREFER_GRPC
+        self.client = self._connect()
         self.collection_name = COLLECTION_NAME
-        self.embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=CHUNK_SIZE,
-            chunk_overlap=CHUNK_OVERLAP,
-            length_function=len,
-        )
+        # Modèle et splitter partagés entre instances (chargés une seule fois)
+        self.embeddings, self.embedding_key, self.text_splitter = _get_shared_models()
+        # Nombre de points connu localement (None = inconnu, à relire côté serveur)
+        self._points_count: Optional[int] = None
+        # Embeddings des questions gardés en mémoire (jamais sur disque)
+        self._embed_query_cached = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._encode_query)
+        
+    def _client_kwargs(self) -> Dict:
+        """Paramètres de connexion communs aux clients sync et async"""
+        return {
+            'url': QDRANT_URL,
+            'api_key': QDRANT_API_KEY,
+            'prefer_grpc': self._prefer_grpc,
+            'grpc_port': QDRANT_GRPC_PORT,
+            'timeout': QDRANT_TIMEOUT,
+        }
+    
+    def _connect(self) -> QdrantClient:
+        """Client Qdrant en gRPC si le port répond, sinon repli sur REST"""
+        client = QdrantClient(**self._client_kwargs())
+        if not self._prefer_grpc or QDRANT_URL == ':memory:':
+            return client
         
+        try:
+            client.get_collections()
+            return client
+        except Exception as e:
+            # Ex: port gRPC non exposé par le serveur / le proxy
+            print(f"⚠️ gRPC Qdrant indisponible ({e}): repli sur REST")
+            client.close()
+            self._prefer_grpc = False
+            return QdrantClient(**self._client_kwargs())
+    
     def create_collection(self) -> str:
         """Crée la collection Qdrant si elle n'existe pas"""
         try:
@@ -42,8 +203,38 @@ class QdrantConnector:
             
             self.client.create_collection(
                 collection_name=self.collection_name,
-                vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
+                # Vecteurs normalisés L2 à l'indexation et à la requête: Dot == Cosine,
+                # sans normalisation côté serveur
+                # float16: moitié moins de mémoire/disque que float32, sans perte de rang utile
+                # Vecteurs originaux sur disque (mmap): seule la copie int8 occupe la RAM,
+                # les originaux ne sont lus que pour le re-classement (rescore)
+                vectors_config=VectorParams(
+                    size=vector_size, distance=Distance.DOT, datatype=Datatype.FLOAT16,
+                    on_disk=True
+                ),
+                # Payload et graphe HNSW en mmap: la RAM reste au cache de pages
+                # (filtres servis par les index de payload, cf. content_hash)
+                on_disk_payload=True,
+                hnsw_config=HnswConfigDiff(m=16, ef_construct=100, on_disk=True),
+                optimizers_config=OptimizersConfigDiff(
+                    memmap_threshold=20000,
+                    indexing_threshold=QDRANT_INDEXING_THRESHOLD
+                ),
+                # Copie int8 des vecteurs gardée en RAM: 4x moins de mémoire pour la recherche
+                quantization_config=ScalarQuantization(
+                    # quantile 0.99: les valeurs extrêmes n'écrasent pas la plage int8
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8, quantile=0.99, always_ram=True
+                    )
+                ),
+            )
+            # Index sur l'empreinte du contenu: détection rapide des re-uploads
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name='content_hash',
+                field_schema=PayloadSchemaType.KEYWORD,
             )
+            self._points_count = 0
             return f"✅ Collection '{self.collection_name}' créée avec succès"
             
         except Exception as e:
@@ -52,15 +243,178 @@ class QdrantConnector:
     def reset_collection(self) -> str:
         """Supprime et recrée la collection"""
         try:
+            self._points_count = None
+            QdrantConnector.write_generation += 1
             self.client.delete_collection(collection_name=self.collection_name)
             return self.create_collection()
         except Exception as e:
             return f"❌ Erreur reset collection: {str(e)}"
     
-    def is_temporal_content(self, filename: str, text: str) -> bool:
-        """Détecte si le contenu est temporel (prix, stock, etc.)"""
-        combined_text = f"{filename} {text}".lower()
-        return any(keyword in combined_text for keyword in TEMPORAL_KEYWORDS)
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """Normalise L2 chaque ligne (les vecteurs nuls restent nuls)"""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+    
+    def _embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Embeddings des chunks (via le cache persistant), normalisés L2, en float32"""
+        vectors = get_or_compute(texts, self.embeddings.embed_documents, self.embedding_key)
+        # Le cache peut contenir des vecteurs encodés avant la normalisation
+        return self._normalize(vectors)
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embeddings des chunks (via le cache persistant), normalisés L2"""
+        return self._embed_documents_array(texts).tolist()
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Encode une question (float32 en lecture seule: partageable depuis le cache)"""
+        vector = np.asarray([self.embeddings.embed_query(query)], dtype=np.float32)
+        # Distance Dot: la question doit être normalisée comme les chunks
+        vector = self._normalize(vector)[0]
+        vector.setflags(write=False)
+        return vector
+    
+    def embed_query(self, query: str) -> List[float]:
+        """Embedding d'une question (cache LRU en mémoire, non persisté sur disque)"""
+        return self._embed_query_cached(query).tolist()
+    
+    def is_temporal_content(self, filename: str, texts: Union[str, Iterable[str]]) -> bool:
+        """
+        Détecte si le contenu est temporel (prix, stock, etc.)
+        
+        Args:
+            filename: Nom du fichier source
+            texts: Texte, ou textes des chunks (parcourus jusqu'au premier match)
+        """
+        # Nom de fichier d'abord: court, souvent suffisant (ex: prix_2025.csv)
+        if has_temporal_keyword(filename):
+            return True
+        
+        if isinstance(texts, str):
+            texts = (texts,)
+        # Aucun mot-clé ne contient d'espace: chercher chunk par chunk équivaut
+        # à chercher dans le texte joint, sans jamais le construire
+        return any(has_temporal_keyword(text) for text in texts)
+    
+    @staticmethod
+    def _content_hash(documents: List[Dict], filename: str) -> str:
+        """Empreinte SHA-256 du fichier (nom + texte des chunks)"""
+        digest = hashlib.sha256(filename.encode('utf-8'))
+        for doc in documents:
+            digest.update(b'\x00')
+            digest.update(doc.get('text', '').encode('utf-8'))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _content_filter(content_hash: str) -> Filter:
+        """Filtre des points d'un contenu donné"""
+        return Filter(must=[
+            FieldCondition(key='content_hash', match=MatchValue(value=content_hash))
+        ])
+    
+    def is_already_indexed(self, content_hash: str, expected_count: int) -> bool:
+        """
+        Vrai si tous les chunks de ce contenu exact sont déjà dans la collection
+        
+        Un upload interrompu (lots déjà envoyés, suite en échec) laisse des
+        points orphelins: ils sont supprimés pour que le fichier soit ré-indexé.
+        """
+        try:
+            result = self.client.count(
+                collection_name=self.collection_name,
+                count_filter=self._content_filter(content_hash),
+                exact=True,
+            )
+            if result.count == expected_count:
+                return True
+            if result.count:
+                self._delete_content(content_hash)
+            return False
+        except Exception:
+            # Dans le doute, on indexe
+            return False
+    
+    def _delete_content(self, content_hash: str) -> None:
+        """Supprime les points d'un contenu (upload partiel)"""
+        self._points_count = None
+        QdrantConnector.write_generation += 1
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(filter=self._content_filter(content_hash)),
+        )
+    
+    def _discard_partial_upload(self, content_hash: str) -> None:
+        """Après un échec: retire les lots déjà envoyés (sinon le fichier passerait pour indexé)"""
+        try:
+            self._delete_content(content_hash)
+        except Exception as e:
+            print(f"⚠️ Nettoyage de l'upload partiel impossible: {e}")
+    
+    def _encode_for_upload(self, texts: List[str]) -> List[List[float]]:
+        """
+        Vecteurs arrondis en float16, comme le stockage Datatype.FLOAT16 de la collection
+        
+        Le gain réel est côté serveur (stockage float16). Sur le fil, le JSON (REST)
+        n'est que ~12% plus court; en gRPC les valeurs partent en float32 (aucun gain).
+        """
+        return self._embed_documents_array(texts).astype(np.float16).tolist()
+    
+    def _prepare_payloads(
+        self, documents: List[Dict], filename: str, content_hash: str
+    ) -> Tuple[List[str], List[str], List[Dict], bool]:
+        """
+        Prépare IDs et payloads des chunks d'un fichier (sans les vecteurs)
+        
+        Returns:
+            (ids, texts, payloads, is_temporal)
+        """
+        texts = [doc.get('text', '') for doc in documents]
+        
+        # Détecter si données temporelles (arrêt au premier chunk concerné)
+        is_temporal = self.is_temporal_content(filename, texts)
+        
+        # Timestamp pour données temporelles (une seule lecture d'horloge par fichier)
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d_%H%M%S") if is_temporal else None
+        indexed_at = now.isoformat()
+        
+        ids = []
+        payloads = []
+        for idx, (text, doc) in enumerate(zip(texts, documents)):
+            metadata = doc.get('metadata', {})
+            
+            # Générer un UUID unique pour chaque point
+            ids.append(str(uuid.uuid4()))
+            
+            # Payload construit en une fois (texte + métadonnées enrichies)
+            payloads.append({
+                'text': text,
+                **metadata,
+                'source': filename,
+                'chunk_index': idx,
+                'is_temporal': is_temporal,
+                'timestamp': timestamp,
+                'indexed_at': indexed_at,
+                'content_hash': content_hash
+            })
+        
+        return ids, texts, payloads, is_temporal
+    
+    @staticmethod
+    def _unchanged_message(filename: str) -> str:
+        """Message de statut d'un re-upload sans changement"""
+        return f"ℹ️ {filename} déjà indexé avec un contenu identique - rien à faire"
+    
+    def _indexed_message(self, count: int, is_temporal: bool) -> str:
+        """Met à jour le compteur local et formate le message de statut"""
+        QdrantConnector.write_generation += 1
+        
+        # IDs uniques: chaque upsert ajoute exactement `count` points
+        if self._points_count is not None:
+            self._points_count += count
+        
+        data_type = "📅 TEMPORELLES (historique)" if is_temporal else "📌 STABLES (écrasement)"
+        return f"✅ {count} chunks indexés - Type: {data_type}"
     
     def index_documents(self, documents: List[Dict], filename: str) -> str:
         """
@@ -73,61 +427,159 @@ class QdrantConnector:
         Returns:
             Message de statut
         """
+        content_hash = None
         try:
+            # Rien à encoder ni à upserter (évite un Batch vide)
             if not documents:
                 return "⚠️ Aucun document à indexer"
             
-            # Détecter si données temporelles
-            full_text = " ".join([doc.get('text', '') for doc in documents])
-            is_temporal = self.is_temporal_content(filename, full_text)
+            # Même fichier, même contenu: ni ré-encodage ni doublons en base
+            content_hash = self._content_hash(documents, filename)
+            if self.is_already_indexed(content_hash, len(documents)):
+                return self._unchanged_message(filename)
             
-            # Timestamp pour données temporelles
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S") if is_temporal else None
+            ids, texts, payloads, is_temporal = self._prepare_payloads(
+                documents, filename, content_hash
+            )
             
-            points = []
-            for idx, doc in enumerate(documents):
-                text = doc.get('text', '')
-                metadata = doc.get('metadata', {})
-                
-                # Générer embedding
-                embedding = self.embeddings.embed_query(text)
-                
-                # Générer un UUID unique pour chaque point
-                point_id = str(uuid.uuid4())
-                
-                # Enrichir métadonnées
-                enhanced_metadata = {
-                    **metadata,
-                    'source': filename,
-                    'chunk_index': idx,
-                    'is_temporal': is_temporal,
-                    'timestamp': timestamp,
-                    'indexed_at': datetime.now().isoformat()
-                }
-                
-                points.append(
-                    PointStruct(
-                        id=point_id,
-                        vector=embedding,
-                        payload={
-                            'text': text,
-                            **enhanced_metadata
-                        }
+            # Upsert dans Qdrant par lots (écrase si ID existe pour données stables)
+            # Pipeline: le lot N+1 est encodé (CPU) pendant l'envoi du lot N (réseau)
+            pending = _EMBED_EXECUTOR.submit(
+                self._encode_for_upload, texts[:UPSERT_BATCH_SIZE]
+            )
+            for start in range(0, len(ids), UPSERT_BATCH_SIZE):
+                end = start + UPSERT_BATCH_SIZE
+                vectors = pending.result()
+                is_last = end >= len(ids)
+                if not is_last:
+                    pending = _EMBED_EXECUTOR.submit(
+                        self._encode_for_upload, texts[end:end + UPSERT_BATCH_SIZE]
                     )
+                # Seul le dernier lot attend: les lots sont appliqués dans l'ordre
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=Batch(ids=ids[start:end], vectors=vectors, payloads=payloads[start:end]),
+                    wait=is_last
                 )
             
-            # Upsert dans Qdrant (écrase si ID existe pour données stables)
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
+            return self._indexed_message(len(ids), is_temporal)
+            
+        except Exception as e:
+            if content_hash:
+                self._discard_partial_upload(content_hash)
+            return f"❌ Erreur indexation: {str(e)}"
+    
+    async def aindex_documents(self, documents: List[Dict], filename: str) -> str:
+        """
+        Variante asynchrone de index_documents
+        
+        Les points sont encodés et envoyés par lots de UPSERT_BATCH_SIZE:
+        le lot N+1 est encodé (thread) pendant l'envoi du lot N, et les lots
+        sont upsertés en parallèle sans attendre leur application (wait=False).
+        Seul le dernier lot attend: les mises à jour étant appliquées dans
+        l'ordre, tout est consultable au retour. Pour un gros upload,
+        l'indexation HNSW est suspendue puis relancée une fois à la fin.
+        
+        Returns:
+            Message de statut
+        """
+        # Le client async en mémoire serait une base distincte de self.client
+        if QDRANT_URL == ':memory:':
+            return self.index_documents(documents, filename)
+        
+        content_hash = None
+        try:
+            if not documents:
+                return "⚠️ Aucun document à indexer"
+            
+            # Même fichier, même contenu: ni ré-encodage ni doublons en base
+            content_hash = self._content_hash(documents, filename)
+            if self.is_already_indexed(content_hash, len(documents)):
+                return self._unchanged_message(filename)
+            
+            ids, texts, payloads, is_temporal = self._prepare_payloads(
+                documents, filename, content_hash
             )
             
-            data_type = "📅 TEMPORELLES (historique)" if is_temporal else "📌 STABLES (écrasement)"
-            return f"✅ {len(points)} chunks indexés - Type: {data_type}"
+            loop = asyncio.get_running_loop()
+            # Client créé par appel: lié à la boucle asyncio courante
+            aclient = AsyncQdrantClient(**self._client_kwargs())
+            bulk = len(ids) >= BULK_UPLOAD_MIN_POINTS
+            uploads = []
+            try:
+                if bulk:
+                    await aclient.update_collection(
+                        collection_name=self.collection_name,
+                        optimizers_config=OptimizersConfigDiff(indexing_threshold=0)
+                    )
+                
+                pending = loop.run_in_executor(
+                    _EMBED_EXECUTOR, self._encode_for_upload, texts[:UPSERT_BATCH_SIZE]
+                )
+                for start in range(0, len(ids), UPSERT_BATCH_SIZE):
+                    end = start + UPSERT_BATCH_SIZE
+                    batch = Batch(
+                        ids=ids[start:end], vectors=await pending, payloads=payloads[start:end]
+                    )
+                    if end >= len(ids):
+                        break
+                    pending = loop.run_in_executor(
+                        _EMBED_EXECUTOR, self._encode_for_upload, texts[end:end + UPSERT_BATCH_SIZE]
+                    )
+                    uploads.append(asyncio.ensure_future(aclient.upsert(
+                        collection_name=self.collection_name, points=batch, wait=False
+                    )))
+                
+                await asyncio.gather(*uploads)
+                await aclient.upsert(collection_name=self.collection_name, points=batch)
+            finally:
+                # En cas d'échec, laisser finir les envois en cours avant de fermer le client
+                await asyncio.gather(*uploads, return_exceptions=True)
+                try:
+                    if bulk:
+                        await aclient.update_collection(
+                            collection_name=self.collection_name,
+                            optimizers_config=OptimizersConfigDiff(
+                                indexing_threshold=QDRANT_INDEXING_THRESHOLD
+                            )
+                        )
+                finally:
+                    await aclient.close()
+            
+            return self._indexed_message(len(ids), is_temporal)
             
         except Exception as e:
+            if content_hash:
+                self._discard_partial_upload(content_hash)
             return f"❌ Erreur indexation: {str(e)}"
     
+    @staticmethod
+    def _hit_to_chunk(hit) -> Dict:
+        """Convertit un résultat Qdrant en chunk (text, metadata, score)"""
+        return {
+            'text': hit.payload.get('text', ''),
+            'metadata': {
+                'source': hit.payload.get('source', 'unknown'),
+                'chunk_index': hit.payload.get('chunk_index', 0),
+                'is_temporal': hit.payload.get('is_temporal', False),
+                'timestamp': hit.payload.get('timestamp'),
+                'indexed_at': hit.payload.get('indexed_at'),
+            },
+            'score': hit.score
+        }
+    
+    @staticmethod
+    def _search_params() -> SearchParams:
+        """
+        Parcours sur les vecteurs int8 (RAM), puis re-classement des
+        top_k * SEARCH_OVERSAMPLING candidats avec les vecteurs originaux
+        """
+        return SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=True, oversampling=SEARCH_OVERSAMPLING
+            )
+        )
+    
     def search(self, query: str, top_k: int = 3) -> List[Dict]:
         """
         Recherche vectorielle dans Qdrant
@@ -140,34 +592,61 @@ class QdrantConnector:
             Liste de chunks avec métadonnées et scores
         """
         try:
-            query_embedding = self.embeddings.embed_query(query)
+            query_embedding = self.embed_query(query)
             
             results = self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
-                limit=top_k
+                limit=top_k,
+                search_params=self._search_params()
             )
             
-            chunks = []
-            for hit in results:
-                chunks.append({
-                    'text': hit.payload.get('text', ''),
-                    'metadata': {
-                        'source': hit.payload.get('source', 'unknown'),
-                        'chunk_index': hit.payload.get('chunk_index', 0),
-                        'is_temporal': hit.payload.get('is_temporal', False),
-                        'timestamp': hit.payload.get('timestamp'),
-                        'indexed_at': hit.payload.get('indexed_at'),
-                    },
-                    'score': hit.score
-                })
-            
-            return chunks
+            return [self._hit_to_chunk(hit) for hit in results]
             
         except Exception as e:
             print(f"❌ Erreur recherche: {str(e)}")
             return []
     
+    def search_many(self, queries: List[str], top_k: int = 3) -> List[List[Dict]]:
+        """
+        Recherche vectorielle de plusieurs questions en un seul appel
+        
+        Les questions sont encodées comme dans search (embed_query + cache LRU:
+        même classement qu'une recherche unitaire), puis envoyées ensemble
+        via search_batch (un aller-retour réseau au lieu d'un par question).
+        
+        Returns:
+            Une liste de chunks par question, dans l'ordre des questions
+        """
+        if not queries:
+            return []
+        
+        try:
+            # Questions en double encodées et cherchées une seule fois
+            unique_queries = list(dict.fromkeys(queries))
+            vectors = [self._embed_query_cached(query).tolist() for query in unique_queries]
+            
+            batch_results = self.client.search_batch(
+                collection_name=self.collection_name,
+                requests=[
+                    SearchRequest(
+                        vector=vector, limit=top_k, with_payload=True,
+                        params=self._search_params()
+                    )
+                    for vector in vectors
+                ]
+            )
+            
+            chunks_by_query = {
+                query: [self._hit_to_chunk(hit) for hit in results]
+                for query, results in zip(unique_queries, batch_results)
+            }
+            return [chunks_by_query[query] for query in queries]
+            
+        except Exception as e:
+            print(f"❌ Erreur recherche: {str(e)}")
+            return [[] for _ in queries]
+    
     def filter_private_chunks(self, chunks: List[Dict]) -> Tuple[List[Dict], int]:
         """
         Filtre les chunks contenant des données privées
@@ -175,26 +654,46 @@ class QdrantConnector:
         Returns:
             (chunks_filtrés, nombre_filtrés)
         """
-        filtered = []
-        filtered_count = 0
+        texts = [chunk.get('text', '') for chunk in chunks]
         
-        for chunk in chunks:
-            text = chunk.get('text', '')
-            if PRIVATE_PATTERN.search(text):
-                filtered_count += 1
-            else:
-                filtered.append(chunk)
+        # Un seul passage regex sur tous les chunks joints par \x00
+        # (\w ne couvre pas \x00: un match ne peut pas chevaucher deux chunks)
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + 1
         
-        return filtered, filtered_count
+        private_idx = {
+            bisect_right(starts, match.start()) - 1
+            for match in PRIVATE_PATTERN.finditer("\x00".join(texts))
+        }
+        
+        filtered = [chunk for i, chunk in enumerate(chunks) if i not in private_idx]
+        return filtered, len(private_idx)
     
-    def get_collection_info(self) -> Dict:
-        """Retourne des infos sur la collection"""
+    def get_collection_info(self, force_refresh: bool = False) -> Dict:
+        """
+        Retourne des infos sur la collection
+        
+        Args:
+            force_refresh: Relire le compteur sur le serveur même si connu localement
+        """
+        if self._points_count is not None and not force_refresh:
+            return {
+                'exists': True,
+                'points_count': self._points_count,
+                'vectors_count': self._points_count
+            }
+        
         try:
             info = self.client.get_collection(collection_name=self.collection_name)
+            self._points_count = info.points_count
             return {
                 'exists': True,
                 'points_count': info.points_count,
                 'vectors_count': info.vectors_count
             }
         except Exception:
+            self._points_count = None
             return {'exists': False}
@@ -5,13 +5,29 @@ Phase 02: Pure Qdrant (vector RAG)
 Phase 03: Hybrid Qdrant + Neo4j (GraphRAG)
 """
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import List, Dict, Tuple
 from langchain_mistralai import ChatMistralAI
 
-from config import MISTRAL_API_KEY, MISTRAL_MODEL, MISTRAL_TEMPERATURE
+from config import (
+    MISTRAL_API_KEY, MISTRAL_MODEL, MISTRAL_TEMPERATURE,
+    SEARCH_MAX_TOP_K, QUERY_CACHE_SIZE
+)
 from qdrant_connect import QdrantConnector
 from neo4j_connect import Neo4jConnector
 
+try:
+    import hyperscan
+except ImportError:  # python-hyperscan optionnel: repli sur les regex `re`
+    hyperscan = None
+
+
+# Threads partagés: recherches Neo4j pendant le batch Qdrant (retrieve_many)
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='retrieve')
+
 
 class HybridRetriever:
     """
@@ -30,11 +46,6 @@ class HybridRetriever:
         """
         self.qdrant = QdrantConnector()
         self.neo4j = Neo4jConnector() if use_neo4j else None
-        self.llm = ChatMistralAI(
-            model=MISTRAL_MODEL,
-            mistral_api_key=MISTRAL_API_KEY,
-            temperature=MISTRAL_TEMPERATURE
-        )
         
         # Patterns pour détecter multi-hop queries (Phase 03)
         self.multi_hop_patterns = [
@@ -55,6 +66,74 @@ class HybridRetriever:
             r'\b(price|prix|cost|tarif)\b',
             r'\b(spec|specification|caractéristique)\b',
         ]
+        
+        # Une alternation compilée par liste: un seul passage regex par catégorie
+        self._multi_hop_re = self._compile_union(self.multi_hop_patterns)
+        self._simple_re = self._compile_union(self.simple_patterns)
+        self._hs_db = self._compile_hyperscan()
+    
+    @cached_property
+    def llm(self) -> ChatMistralAI:
+        """Client Mistral, créé à la première génération (routing et tests n'en ont pas besoin)"""
+        return ChatMistralAI(
+            model=MISTRAL_MODEL,
+            mistral_api_key=MISTRAL_API_KEY,
+            temperature=MISTRAL_TEMPERATURE
+        )
+    
+    @staticmethod
+    def _compile_union(patterns: List[str]) -> "re.Pattern":
+        """Compile une liste de patterns en une seule regex (?:p1)|(?:p2)|..."""
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    
+    def _compile_hyperscan(self):
+        """
+        Compile tous les patterns de routing en une base Hyperscan (un seul DFA)
+        
+        Returns:
+            Base Hyperscan, ou None si indisponible (repli sur `re`)
+        """
+        if hyperscan is None:
+            return None
+        
+        patterns = self.multi_hop_patterns + self.simple_patterns
+        flags = (
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+        )
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[p.encode('utf-8') for p in patterns],
+                ids=list(range(len(patterns))),
+                flags=[flags] * len(patterns),
+            )
+            return db
+        except hyperscan.error as e:
+            print(f"⚠️ Hyperscan indisponible pour le routing ({e}): repli sur re")
+            return None
+    
+    def _match_categories(self, query: str) -> Tuple[bool, bool]:
+        """
+        Détecte les catégories de patterns présentes dans la query
+        
+        Returns:
+            (is_multi_hop, is_simple)
+        """
+        if self._hs_db is None:
+            return bool(self._multi_hop_re.search(query)), bool(self._simple_re.search(query))
+        
+        # Un seul passage sur la query pour les deux listes de patterns
+        matched_ids = set()
+        self._hs_db.scan(
+            query.encode('utf-8'),
+            match_event_handler=lambda pattern_id, start, end, flags, context: matched_ids.add(pattern_id)
+        )
+        n_multi_hop = len(self.multi_hop_patterns)
+        return (
+            any(i < n_multi_hop for i in matched_ids),
+            any(i >= n_multi_hop for i in matched_ids)
+        )
     
     def route_query(self, query: str) -> str:
         """
@@ -68,23 +147,13 @@ class HybridRetriever:
             return 'qdrant'
         
         # Phase 03: Routing intelligent
-        query_lower = query.lower()
+        is_multi_hop, is_simple = self._match_categories(query)
         
         # Check multi-hop patterns
-        is_multi_hop = any(
-            re.search(pattern, query_lower, re.IGNORECASE) 
-            for pattern in self.multi_hop_patterns
-        )
-        
         if is_multi_hop:
             return 'neo4j'
         
         # Check simple patterns
-        is_simple = any(
-            re.search(pattern, query_lower, re.IGNORECASE)
-            for pattern in self.simple_patterns
-        )
-        
         if is_simple:
             return 'qdrant'
         
@@ -120,6 +189,46 @@ class HybridRetriever:
             chunks = self.qdrant.search(query, top_k)
             return chunks, 'qdrant (fallback)'
     
+    def retrieve_many(self, queries: List[str], top_k: int = 3) -> List[Tuple[List[Dict], str]]:
+        """
+        Retrieve de plusieurs questions (éval, tests, batch)
+        
+        Les recherches Qdrant de toutes les questions sont regroupées
+        en un seul search_batch; Neo4j reste interrogé question par question.
+        
+        Returns:
+            [(chunks, route_used)] dans l'ordre des questions
+        """
+        routes = [self.route_query(query) for query in queries]
+        
+        # Questions nécessitant une recherche Qdrant (qdrant, hybrid, fallback)
+        qdrant_idx = [
+            i for i, route in enumerate(routes)
+            if not (route == 'neo4j' and self.neo4j)
+        ]
+        # Questions purement graphe: lancées pendant le batch Qdrant
+        # (le mode hybrid enrichit les chunks Qdrant, il doit les attendre)
+        graph_futures = {
+            i: _IO_EXECUTOR.submit(self.neo4j.search_graph, queries[i])
+            for i, route in enumerate(routes)
+            if route == 'neo4j' and self.neo4j
+        }
+        qdrant_results = self.qdrant.search_many([queries[i] for i in qdrant_idx], top_k)
+        qdrant_chunks = dict(zip(qdrant_idx, qdrant_results))
+        
+        results = []
+        for i, route in enumerate(routes):
+            if route == 'qdrant':
+                results.append((qdrant_chunks[i], 'qdrant'))
+            elif route == 'neo4j' and self.neo4j:
+                results.append((graph_futures[i].result(), 'neo4j'))
+            elif route == 'hybrid' and self.neo4j:
+                results.append((self.neo4j.enrich_context(qdrant_chunks[i]), 'hybrid'))
+            else:
+                results.append((qdrant_chunks[i], 'qdrant (fallback)'))
+        
+        return results
+    
     def generate_answer(self, query: str, chunks: List[Dict], route_used: str) -> str:
         """
         Génère une réponse basée sur les chunks récupérés
@@ -236,10 +345,40 @@ class SimpleRAG:
     
     def __init__(self):
         self.retriever = HybridRetriever(use_neo4j=False)
+        # question -> (génération Qdrant, top_k récupéré, chunks, route)
+        self._results: "OrderedDict[str, Tuple[int, int, List[Dict], str]]" = OrderedDict()
+        self._results_lock = threading.Lock()
+    
+    def _retrieve_cached(self, query: str, top_k: int) -> Tuple[List[Dict], str]:
+        """
+        Récupère les chunks d'une question, une seule fois par question
+        
+        La recherche est faite au maximum du slider: changer top_k ne fait
+        que re-découper les résultats, sans nouvel embedding ni appel Qdrant.
+        Le cache est invalidé dès qu'un document est indexé ou la base vidée.
+        """
+        generation = QdrantConnector.write_generation
+        with self._results_lock:
+            cached = self._results.get(query)
+            if cached is not None and cached[0] == generation and cached[1] >= top_k:
+                self._results.move_to_end(query)
+                _, _, chunks, route = cached
+                return chunks[:top_k], route
+        
+        max_k = max(top_k, SEARCH_MAX_TOP_K)
+        chunks, route = self.retriever.retrieve(query, max_k)
+        
+        with self._results_lock:
+            self._results[query] = (generation, max_k, chunks, route)
+            self._results.move_to_end(query)
+            while len(self._results) > QUERY_CACHE_SIZE:
+                self._results.popitem(last=False)
+        
+        return chunks[:top_k], route
     
     def search_and_answer(self, query: str, top_k: int = 3) -> str:
         """
         Recherche et génère une réponse (Phase 02)
         """
-        chunks, route = self.retriever.retrieve(query, top_k)
+        chunks, route = self._retrieve_cached(query, top_k)
         return self.retriever.generate_answer(query, chunks, route)
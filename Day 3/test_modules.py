@@ -1,7 +1,32 @@
 """
 Test Script - Validation du découpage modulaire
 """
+import io
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _ThreadLocalStdout:
+    """Redirige print() vers un buffer propre à chaque thread de test"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self) -> io.StringIO:
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._stream).write(text)
+    
+    def flush(self):
+        getattr(self._local, 'buffer', self._stream).flush()
+    
+    def __getattr__(self, name):
+        # encoding, isatty, fileno...: ceux du vrai stdout
+        return getattr(self._stream, name)
 
 def test_imports():
     """Test que tous les modules s'importent correctement"""
@@ -91,6 +116,16 @@ def test_qdrant_connector():
         assert qdrant.is_temporal_content("politique_rh.pdf", "Règles internes") == False
         print("  ✅ Détection stable (politique)")
         
+        assert qdrant.is_temporal_content("rapport.pdf", ["Introduction", "Budget 2025"]) == True
+        print("  ✅ Détection temporelle sur une liste de chunks")
+        
+        # Automate Aho-Corasick (si installé) et regex de repli: même verdict
+        from qdrant_connect import has_temporal_keyword
+        from config import TEMPORAL_PATTERN
+        for sample in ["PRIX unitaire", "Règles internes", "inventaire Q3", "", "KPI: 12%"]:
+            assert has_temporal_keyword(sample) == bool(TEMPORAL_PATTERN.search(sample))
+        print("  ✅ Aho-Corasick cohérent avec TEMPORAL_PATTERN")
+        
         # Test collection creation
         result = qdrant.create_collection()
         print(f"  ✅ Collection: {result}")
@@ -123,6 +158,20 @@ def test_document_utils():
         
         print(f"  ✅ Chunking OK - {len(docs)} chunks créés")
         
+        # CSV → une ligne "colonne: valeur" par enregistrement
+        import os
+        import tempfile
+        from document_utils import load_document
+        
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("produit,prix\nSolarMax,599\nSolarMini,199\n")
+        
+        try:
+            assert load_document(f.name) == "produit: SolarMax, prix: 599\nproduit: SolarMini, prix: 199"
+        finally:
+            os.remove(f.name)
+        print("  ✅ Chargement CSV OK")
+        
         return True
         
     except Exception as e:
@@ -130,6 +179,54 @@ def test_document_utils():
         return False
 
 
+def test_embedding_cache():
+    """Test du cache persistant d'embeddings (encodeur factice)"""
+    print("\n🧪 Test 5: Embedding Cache...")
+    
+    import os
+    import tempfile
+    import embedding_cache
+    
+    tmp_dir = tempfile.mkdtemp()
+    original_path = embedding_cache.EMBEDDING_CACHE_PATH
+    original_connection = embedding_cache._connection
+    
+    try:
+        embedding_cache.EMBEDDING_CACHE_PATH = os.path.join(tmp_dir, 'cache.sqlite')
+        embedding_cache._connection = None
+        
+        calls = []
+        
+        def fake_encode(texts):
+            calls.append(list(texts))
+            return [[float(len(t)), 1.0] for t in texts]
+        
+        # Miss + doublon dans le batch → un seul encodage par texte unique
+        vectors = embedding_cache.get_or_compute(["a", "bb", "a"], fake_encode)
+        assert vectors.shape == (3, 2)
+        assert calls == [["a", "bb"]]
+        assert vectors[0].tolist() == vectors[2].tolist() == [1.0, 1.0]
+        print("  ✅ Misses encodés une seule fois (doublons inclus)")
+        
+        # Hit partiel → seul le nouveau texte est encodé
+        vectors = embedding_cache.get_or_compute(["bb", "ccc"], fake_encode)
+        assert calls == [["a", "bb"], ["ccc"]]
+        assert vectors.tolist() == [[2.0, 1.0], [3.0, 1.0]]
+        print("  ✅ Hits servis depuis SQLite")
+        
+        return True
+        
+    except Exception as e:
+        print(f"  ❌ Erreur embedding cache: {e}")
+        return False
+    
+    finally:
+        if embedding_cache._connection is not None:
+            embedding_cache._connection.close()
+        embedding_cache.EMBEDDING_CACHE_PATH = original_path
+        embedding_cache._connection = original_connection
+
+
 def run_all_tests():
     """Execute tous les tests"""
     print("="*70)
@@ -142,15 +239,36 @@ def run_all_tests():
         test_qdrant_connector,
         test_document_utils,
     ]
+    # Modifient des globales de module (ex: chemin du cache SQLite): seuls, après les autres
+    serial_tests = [
+        test_embedding_cache,
+    ]
     
-    results = []
-    for test_func in tests:
+    # Tests indépendants lancés en parallèle (imports / chargement du modèle
+    # libèrent le GIL); sorties bufferisées puis affichées dans l'ordre
+    stdout = _ThreadLocalStdout(sys.stdout)
+    
+    def run_test(test_func):
+        buffer = stdout.capture()
         try:
             result = test_func()
-            results.append(result)
         except Exception as e:
             print(f"\n❌ Test {test_func.__name__} crashed: {e}")
-            results.append(False)
+            result = False
+        return result, buffer.getvalue()
+    
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            outcomes = list(executor.map(run_test, tests))
+        outcomes.extend(run_test(test_func) for test_func in serial_tests)
+    finally:
+        sys.stdout = stdout._stream
+    
+    results = []
+    for result, output in outcomes:
+        print(output, end='')
+        results.append(result)
     
     print("\n" + "="*70)
     print("📊 RÉSULTATS")